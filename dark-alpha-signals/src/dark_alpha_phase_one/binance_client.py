@@ -2,7 +2,15 @@ from __future__ import annotations
 
 import logging
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is an optional accelerator; stdlib json works too
+    from json import loads as _json_loads
 
 from .calculations import Candle
 
@@ -11,6 +19,15 @@ class BinanceFuturesClient:
     def __init__(self, base_url: str = "https://fapi.binance.com") -> None:
         self.base_url = base_url
         self.session = requests.Session()
+        # Size the pool for the concurrent fetches and absorb transient
+        # gateway errors with a short retry instead of surfacing them to
+        # the poll loop.
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount("https://", adapter)
 
     def get_latest_price(self, symbol: str) -> float:
         resp = self.session.get(
@@ -21,6 +38,16 @@ class BinanceFuturesClient:
         logging.debug("Fetched latest price for %s: %.4f", symbol, price)
         return price
 
+    def get_all_prices(self) -> dict[str, float]:
+        # One round-trip for every symbol: the ticker endpoint returns all
+        # prices when no symbol filter is passed.
+        resp = self.session.get(f"{self.base_url}/fapi/v1/ticker/price", timeout=10)
+        resp.raise_for_status()
+        payload = _json_loads(resp.content)
+        prices = {item["symbol"]: float(item["price"]) for item in payload}
+        logging.debug("Fetched %d ticker prices in one call", len(prices))
+        return prices
+
     def get_1m_klines(self, symbol: str, limit: int = 300) -> list[Candle]:
         resp = self.session.get(
             f"{self.base_url}/fapi/v1/klines",
@@ -28,16 +55,14 @@ class BinanceFuturesClient:
             timeout=10,
         )
         resp.raise_for_status()
-        raw = resp.json()
-        candles = [
-            Candle(
-                open=float(kline[1]),
-                high=float(kline[2]),
-                low=float(kline[3]),
-                close=float(kline[4]),
-            )
-            for kline in raw
-        ]
+        raw = _json_loads(resp.content)
+        if not raw:
+            return []
+        # Parse the stringified OHLC columns in one vectorized astype pass
+        # instead of 4 x N Python float() calls. tolist() hands back Python
+        # floats so the Candles stay orjson-serializable downstream.
+        ohlc = np.asarray(raw, dtype=object)[:, 1:5].astype(np.float64)
+        candles = [Candle(open=o, high=h, low=l, close=c) for o, h, l, c in ohlc.tolist()]
         logging.debug("Fetched %d 1m klines for %s", len(candles), symbol)
         return candles
 
@@ -48,6 +73,13 @@ class BinanceFuturesClient:
         resp.raise_for_status()
         return resp.json()
 
+    def get_premium_index_all(self) -> list[dict[str, object]]:
+        # Without a symbol filter the endpoint returns every symbol's
+        # premium index in one round-trip.
+        resp = self.session.get(f"{self.base_url}/fapi/v1/premiumIndex", timeout=10)
+        resp.raise_for_status()
+        return _json_loads(resp.content)
+
     def get_funding_rate_history(self, symbol: str, limit: int = 3) -> list[dict[str, object]]:
         resp = self.session.get(
             f"{self.base_url}/fapi/v1/fundingRate", params={"symbol": symbol, "limit": limit}, timeout=10
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
+from math import sqrt
+from operator import attrgetter
 from statistics import mean, pstdev
 
+import numpy as np
 
-@dataclass(frozen=True)
+from .calculations_numba import tr_and_atr
+
+
+@dataclass(frozen=True, slots=True)
 class Candle:
     open: float
     high: float
@@ -13,6 +20,22 @@ class Candle:
     close: float
 
 
+# map(attrgetter(...), ...) keeps the field-extraction loops in C, vs. the
+# per-yield frame overhead of a generator expression.
+_OPEN = attrgetter("open")
+_HIGH = attrgetter("high")
+_LOW = attrgetter("low")
+_CLOSE = attrgetter("close")
+
+
+def candles_to_arrays(candles: list[Candle]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    count = len(candles)
+    highs = np.fromiter(map(_HIGH, candles), dtype=np.float64, count=count)
+    lows = np.fromiter(map(_LOW, candles), dtype=np.float64, count=count)
+    closes = np.fromiter(map(_CLOSE, candles), dtype=np.float64, count=count)
+    return highs, lows, closes
+
+
 def calculate_return(closes: list[float], lookback_minutes: int = 5) -> float:
     required = lookback_minutes + 1
     if len(closes) < required:
@@ -26,49 +49,99 @@ def calculate_return(closes: list[float], lookback_minutes: int = 5) -> float:
 
 
 def aggregate_klines_to_window(candles_1m: list[Candle], window: int = 15) -> list[Candle]:
-    if len(candles_1m) < window:
+    bucket_count = len(candles_1m) // window
+    if bucket_count == 0:
         return []
 
-    grouped: list[Candle] = []
-    for i in range(window, len(candles_1m) + 1, window):
-        chunk = candles_1m[i - window : i]
-        grouped.append(
-            Candle(
-                open=chunk[0].open,
-                high=max(c.high for c in chunk),
-                low=min(c.low for c in chunk),
-                close=chunk[-1].close,
-            )
+    trimmed = candles_1m[: bucket_count * window]
+    count = len(trimmed)
+    opens = np.fromiter(map(_OPEN, trimmed), dtype=np.float64, count=count)
+    highs, lows, closes = candles_to_arrays(trimmed)
+
+    bucket_opens = opens.reshape(-1, window)[:, 0]
+    bucket_highs = highs.reshape(-1, window).max(axis=1)
+    bucket_lows = lows.reshape(-1, window).min(axis=1)
+    bucket_closes = closes.reshape(-1, window)[:, -1]
+
+    # tolist() converts to Python floats so the Candles stay
+    # orjson-serializable downstream.
+    return [
+        Candle(open=o, high=h, low=l, close=c)
+        for o, h, l, c in zip(
+            bucket_opens.tolist(), bucket_highs.tolist(), bucket_lows.tolist(), bucket_closes.tolist()
         )
-    return grouped
+    ]
 
 
-def true_ranges(candles: list[Candle]) -> list[float]:
-    trs: list[float] = []
-    for idx, candle in enumerate(candles):
-        if idx == 0:
-            tr = candle.high - candle.low
-        else:
-            prev_close = candles[idx - 1].close
-            tr = max(
-                candle.high - candle.low,
-                abs(candle.high - prev_close),
-                abs(candle.low - prev_close),
-            )
-        trs.append(tr)
+def true_ranges_array(candles: list[Candle]) -> np.ndarray:
+    if not candles:
+        return np.empty(0, dtype=np.float64)
+
+    highs, lows, closes = candles_to_arrays(candles)
+    prev_closes = np.concatenate(([closes[0]], closes[:-1]))
+    trs = np.maximum(
+        highs - lows,
+        np.maximum(np.abs(highs - prev_closes), np.abs(lows - prev_closes)),
+    )
+    trs[0] = highs[0] - lows[0]
     return trs
 
 
-def atr_series(candles: list[Candle], period: int = 14) -> list[float]:
-    trs = true_ranges(candles)
+# Below this size the NumPy call overhead outweighs the vectorization win,
+# so the list-returning shims keep a preallocated pure-Python path.
+_SMALL_INPUT = 32
+
+
+def _true_ranges_small(candles: list[Candle]) -> list[float]:
+    count = len(candles)
+    trs = [0.0] * count
+    if count == 0:
+        return trs
+    trs[0] = candles[0].high - candles[0].low
+    for idx in range(1, count):
+        candle = candles[idx]
+        prev_close = candles[idx - 1].close
+        trs[idx] = max(
+            candle.high - candle.low,
+            abs(candle.high - prev_close),
+            abs(candle.low - prev_close),
+        )
+    return trs
+
+
+def true_ranges(candles: list[Candle]) -> list[float]:
+    if len(candles) <= _SMALL_INPUT:
+        return _true_ranges_small(candles)
+    return true_ranges_array(candles).tolist()
+
+
+def atr_series_array(candles: list[Candle], period: int = 14) -> np.ndarray:
+    if tr_and_atr is not None:
+        highs, lows, closes = candles_to_arrays(candles)
+        _, atrs = tr_and_atr(highs, lows, closes, period)
+        return atrs
+
+    trs = true_ranges_array(candles)
     if len(trs) < period:
-        return []
+        return np.empty(0, dtype=np.float64)
 
-    atrs: list[float] = []
-    for end in range(period, len(trs) + 1):
-        window = trs[end - period : end]
-        atrs.append(sum(window) / period)
-    return atrs
+    cumsum = np.concatenate(([0.0], np.cumsum(trs)))
+    return (cumsum[period:] - cumsum[:-period]) * (1.0 / period)
+
+
+def atr_series(candles: list[Candle], period: int = 14) -> list[float]:
+    if len(candles) <= _SMALL_INPUT:
+        trs = _true_ranges_small(candles)
+        if len(trs) < period:
+            return []
+        running = sum(trs[:period])
+        atrs = [0.0] * (len(trs) - period + 1)
+        atrs[0] = running / period
+        for idx in range(period, len(trs)):
+            running += trs[idx] - trs[idx - period]
+            atrs[idx - period + 1] = running / period
+        return atrs
+    return atr_series_array(candles, period=period).tolist()
 
 
 def calculate_position_usdt(entry: float, stop: float, max_risk_usdt: float) -> float:
@@ -79,13 +152,18 @@ def calculate_position_usdt(entry: float, stop: float, max_risk_usdt: float) ->
 
 
 def aggregate_oi_to_15m(oi_series: list[tuple[datetime, float]]) -> list[float]:
-    if not oi_series:
-        return []
-    bucket: dict[int, float] = {}
+    # The series is appended in time order, so one ordered sweep keeping the
+    # last value per 15-minute bucket replaces the dict + sorted() pass.
+    windows: list[float] = []
+    current_key: int | None = None
     for ts, oi in oi_series:
         bucket_key = int(ts.timestamp()) // (15 * 60)
-        bucket[bucket_key] = oi
-    return [bucket[key] for key in sorted(bucket.keys())]
+        if bucket_key == current_key:
+            windows[-1] = oi
+        else:
+            windows.append(oi)
+            current_key = bucket_key
+    return windows
 
 
 def compute_oi_zscore_15m(oi_windows: list[float], baseline_windows: int = 96) -> float | None:
@@ -101,6 +179,48 @@ def compute_oi_zscore_15m(oi_windows: list[float], baseline_windows: int = 96) -
     return (current - mean(baseline)) / sigma
 
 
+class OiRunningStats:
+    # Streaming counterpart of compute_oi_zscore_15m / compute_oi_delta_pct_15m:
+    # completed 15m windows are pushed once and the baseline sum/sum-of-squares
+    # are maintained incrementally, so each poll costs O(1) instead of
+    # re-scanning up to 96 windows.
+    __slots__ = ("_baseline", "_sum", "_sumsq")
+
+    def __init__(self, baseline_windows: int = 96) -> None:
+        self._baseline: deque[float] = deque(maxlen=baseline_windows)
+        self._sum = 0.0
+        self._sumsq = 0.0
+
+    def push(self, value: float) -> None:
+        baseline = self._baseline
+        if len(baseline) == baseline.maxlen:
+            evicted = baseline[0]
+            self._sum -= evicted
+            self._sumsq -= evicted * evicted
+        baseline.append(value)
+        self._sum += value
+        self._sumsq += value * value
+
+    def zscore(self, current: float) -> float | None:
+        count = len(self._baseline)
+        if count < 2:
+            return None
+        baseline_mean = self._sum / count
+        variance = max(self._sumsq / count - baseline_mean * baseline_mean, 0.0)
+        sigma = sqrt(variance)
+        if sigma == 0:
+            return 0.0
+        return (current - baseline_mean) / sigma
+
+    def delta_pct(self, current: float) -> float | None:
+        if not self._baseline:
+            return None
+        prev = self._baseline[-1]
+        if prev == 0:
+            return None
+        return (current - prev) / prev
+
+
 def compute_oi_delta_pct_15m(oi_windows: list[float]) -> float | None:
     if len(oi_windows) < 2:
         return None
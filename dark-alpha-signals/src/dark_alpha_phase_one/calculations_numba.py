@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator; fall back to pure Python
+    njit = None
+
+
+def _atr_update(
+    prev_atr: float,
+    prev_close: float,
+    high: float,
+    low: float,
+    close: float,
+    period: int,
+) -> tuple[float, float]:
+    tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+    return prev_atr + (tr - prev_atr) / period, tr
+
+
+def _tr_and_atr(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    period: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    count = highs.shape[0]
+    trs = np.empty(count, dtype=np.float64)
+    if count == 0:
+        return trs, np.empty(0, dtype=np.float64)
+
+    trs[0] = highs[0] - lows[0]
+    for i in range(1, count):
+        prev_close = closes[i - 1]
+        tr = highs[i] - lows[i]
+        high_gap = abs(highs[i] - prev_close)
+        if high_gap > tr:
+            tr = high_gap
+        low_gap = abs(lows[i] - prev_close)
+        if low_gap > tr:
+            tr = low_gap
+        trs[i] = tr
+
+    if count < period:
+        return trs, np.empty(0, dtype=np.float64)
+
+    atrs = np.empty(count - period + 1, dtype=np.float64)
+    running = 0.0
+    for i in range(period):
+        running += trs[i]
+    atrs[0] = running / period
+    for i in range(period, count):
+        running += trs[i] - trs[i - period]
+        atrs[i - period + 1] = running / period
+    return trs, atrs
+
+
+if njit is not None:
+    atr_update = njit(cache=True, fastmath=True)(_atr_update)
+    atr_update(0.0, 0.0, 1.0, 0.0, 0.5, 14)  # warm-up compile at import
+    tr_and_atr = njit(cache=True, fastmath=True)(_tr_and_atr)
+    tr_and_atr(np.ones(2), np.zeros(2), np.ones(2), 2)  # warm-up compile at import
+else:
+    atr_update = _atr_update
+    tr_and_atr = None  # pure-Python loop would be slower than the NumPy path
+
+
+class StreamingAtr:
+    def __init__(self, period: int = 14) -> None:
+        self.period = period
+        self._atr: float | None = None
+        self._prev_close: float | None = None
+        self._warmup_trs: list[float] = []
+
+    @property
+    def value(self) -> float | None:
+        return self._atr
+
+    def update(self, high: float, low: float, close: float) -> float | None:
+        if self._prev_close is None:
+            tr = high - low
+        elif self._atr is not None:
+            self._atr, tr = atr_update(self._atr, self._prev_close, high, low, close, self.period)
+            self._prev_close = close
+            return self._atr
+        else:
+            tr = max(high - low, abs(high - self._prev_close), abs(low - self._prev_close))
+
+        self._warmup_trs.append(tr)
+        self._prev_close = close
+        if len(self._warmup_trs) >= self.period:
+            self._atr = sum(self._warmup_trs) / self.period
+            self._warmup_trs = []
+        return self._atr
@@ -7,6 +7,11 @@ from dark_alpha_phase_one.binance_client import BinanceFuturesClient
 from dark_alpha_phase_one.calculations import Candle
 from dark_alpha_phase_one.data.datastore import FundingRatePoint
 
+# Hoisted once: datetime.now / timezone.utc attribute lookups otherwise
+# repeat on every fetch in the poll cycle.
+_UTC = timezone.utc
+_now = datetime.now
+
 
 class BinanceRestDataClient:
     def __init__(self) -> None:
@@ -14,18 +19,23 @@ class BinanceRestDataClient:
 
     def fetch_price(self, symbol: str) -> tuple[float, datetime]:
         price = self._client.get_latest_price(symbol)
-        ts = datetime.now(tz=timezone.utc)
+        ts = _now(tz=_UTC)
         return price, ts
 
+    def fetch_prices(self, symbols: list[str]) -> list[tuple[str, float, datetime]]:
+        prices = self._client.get_all_prices()
+        ts = _now(tz=_UTC)
+        return [(symbol, prices[symbol], ts) for symbol in symbols if symbol in prices]
+
     def fetch_klines(self, symbol: str, limit: int) -> tuple[list[Candle], datetime]:
         klines = self._client.get_1m_klines(symbol, limit=limit)
-        ts = datetime.now(tz=timezone.utc)
+        ts = _now(tz=_UTC)
         logging.debug("REST fetched %s klines for %s", len(klines), symbol)
         return klines, ts
 
     def fetch_premium_index(self, symbol: str) -> tuple[float, float, int, datetime]:
         payload = self._client.get_premium_index(symbol)
-        ts = datetime.now(tz=timezone.utc)
+        ts = _now(tz=_UTC)
         return (
             float(payload["markPrice"]),
             float(payload["lastFundingRate"]),
@@ -33,9 +43,26 @@ class BinanceRestDataClient:
             ts,
         )
 
+    def fetch_premium_index_all(
+        self, symbols: list[str]
+    ) -> list[tuple[str, float, float, int, datetime]]:
+        payload = {item["symbol"]: item for item in self._client.get_premium_index_all()}
+        ts = _now(tz=_UTC)
+        return [
+            (
+                symbol,
+                float(payload[symbol]["markPrice"]),
+                float(payload[symbol]["lastFundingRate"]),
+                int(payload[symbol]["nextFundingTime"]),
+                ts,
+            )
+            for symbol in symbols
+            if symbol in payload
+        ]
+
     def fetch_funding_rate_history(self, symbol: str, limit: int = 3) -> tuple[list[FundingRatePoint], datetime]:
         payload = self._client.get_funding_rate_history(symbol, limit=limit)
-        ts = datetime.now(tz=timezone.utc)
+        ts = _now(tz=_UTC)
         history = [
             FundingRatePoint(
                 funding_rate=float(item["fundingRate"]),
@@ -47,7 +74,7 @@ class BinanceRestDataClient:
 
     def fetch_open_interest(self, symbol: str) -> tuple[float, datetime]:
         payload = self._client.get_open_interest(symbol)
-        ts = datetime.now(tz=timezone.utc)
+        ts = _now(tz=_UTC)
         return float(payload["openInterest"]), ts
 
     def fetch_server_time_ms(self) -> int:
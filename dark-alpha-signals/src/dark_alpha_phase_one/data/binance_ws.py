@@ -2,10 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-import json
 import logging
 from typing import Any, Callable
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is an optional accelerator; stdlib json works too
+    from json import loads as _json_loads
+
 from dark_alpha_phase_one.calculations import Candle
 
 
@@ -30,29 +34,40 @@ class BinanceWsClient:
         self,
         symbols: list[str],
         read_timeout_seconds: float = 0.2,
+        drain_timeout_seconds: float = 0.01,
         ws_factory: Callable[[], Any] | None = None,
     ) -> None:
         self.symbols = symbols
         self.read_timeout_seconds = read_timeout_seconds
+        self.drain_timeout_seconds = drain_timeout_seconds
         self._ws_factory = ws_factory or self._default_ws_factory
         self._ws: Any | None = None
         self.connected = False
+        # Close/status code from the last failed read or handshake, when the
+        # underlying exception carries one; lets the manager distinguish
+        # server-initiated overload (1012/1013) from ordinary drops.
+        self.last_close_code: int | None = None
+
+        # Reconnects under backoff churn can be frequent; build the stream
+        # URL once instead of re-lowercasing every symbol per attempt.
+        lower_symbols = tuple(symbol.lower() for symbol in symbols)
+        self._streams = "/".join(f"{lower}@bookTicker/{lower}@kline_1m" for lower in lower_symbols)
+        self._stream_url = f"wss://fstream.binance.com/stream?streams={self._streams}"
+
+        # One dict lookup per frame instead of chained string compares.
+        self._dispatch: dict[str, Callable[[dict[str, Any], list[WsTick], list[WsKlineTick]], None]] = {
+            "bookTicker": self._on_book_ticker,
+            "kline": self._on_kline,
+        }
 
     def connect(self) -> None:
-        stream_parts: list[str] = []
-        for symbol in self.symbols:
-            lower = symbol.lower()
-            stream_parts.append(f"{lower}@bookTicker")
-            stream_parts.append(f"{lower}@kline_1m")
-        streams = "/".join(stream_parts)
-        url = f"wss://fstream.binance.com/stream?streams={streams}"
-
+        self.last_close_code = None
         ws = self._ws_factory()
         ws.settimeout(self.read_timeout_seconds)
-        ws.connect(url)
+        ws.connect(self._stream_url)
         self._ws = ws
         self.connected = True
-        logging.info("WS connected stream=%s", streams)
+        logging.info("WS connected stream=%s", self._streams)
 
     def close(self) -> None:
         if self._ws is not None:
@@ -70,73 +85,112 @@ class BinanceWsClient:
 
         ticks: list[WsTick] = []
         kline_ticks: list[WsKlineTick] = []
+        dispatch_get = self._dispatch.get
+        draining = False
 
-        while True:
-            try:
-                raw = self._ws.recv()
-            except Exception as exc:  # includes timeout/non-blocking behavior
-                if self._is_timeout_exception(exc):
-                    break
-                raise
-
-            message = self._safe_parse(raw)
-            if not message:
-                continue
-
-            data = message.get("data", message)
-            event_type = data.get("e")
-            event_ts = self._event_ts(data)
-
-            if event_type == "bookTicker":
-                symbol = str(data.get("s", "")).upper()
-                bid = self._to_float(data.get("b"))
-                ask = self._to_float(data.get("a"))
-                if symbol and (bid is not None or ask is not None):
-                    price = (bid + ask) / 2.0 if bid is not None and ask is not None else (bid or ask)
-                    ticks.append(WsTick(symbol=symbol, price=float(price), ts=event_ts))
-            elif event_type == "kline":
-                kline_data = data.get("k", {})
-                symbol = str(data.get("s", "")).upper()
-                candle = self._kline_to_candle(kline_data)
-                open_time = kline_data.get("t")
-                is_closed = bool(kline_data.get("x", False))
-                if symbol and candle and isinstance(open_time, int):
-                    kline_ticks.append(
-                        WsKlineTick(
-                            symbol=symbol,
-                            candle=candle,
-                            open_time_ms=open_time,
-                            is_closed=is_closed,
-                            ts=event_ts,
-                        )
-                    )
+        try:
+            while True:
+                try:
+                    raw = self._ws.recv()
+                except Exception as exc:  # includes timeout/non-blocking behavior
+                    if self._is_timeout_exception(exc):
+                        break
+                    code = getattr(exc, "status_code", None)
+                    if isinstance(code, int):
+                        self.last_close_code = code
+                    raise
+
+                if not draining:
+                    # A burst is in flight: drain the remaining buffered
+                    # frames with a short timeout so an empty buffer does
+                    # not park the poll loop for the full read timeout.
+                    self._ws.settimeout(self.drain_timeout_seconds)
+                    draining = True
+
+                message = self._safe_parse(raw)
+                if not message:
+                    continue
+
+                data = message.get("data", message)
+                handler = dispatch_get(data.get("e"))
+                if handler is not None:
+                    handler(data, ticks, kline_ticks)
+        finally:
+            if draining:
+                self._ws.settimeout(self.read_timeout_seconds)
 
         return ticks, kline_ticks
 
-    @staticmethod
-    def _safe_parse(raw: Any) -> dict[str, Any] | None:
+    def _on_book_ticker(
+        self,
+        data: dict[str, Any],
+        ticks: list[WsTick],
+        kline_ticks: list[WsKlineTick],
+    ) -> None:
+        symbol = str(data.get("s", "")).upper()
+        if not symbol:
+            return
+        # Each side parses independently so one malformed side falls back to
+        # the other's price instead of dropping the whole tick.
+        bid = self._side_price(data.get("b"))
+        ask = self._side_price(data.get("a"))
+        if bid is not None and ask is not None:
+            price = (bid + ask) * 0.5
+        elif bid is not None:
+            price = bid
+        elif ask is not None:
+            price = ask
+        else:
+            return
+        ticks.append(WsTick(symbol=symbol, price=price, ts=self._event_ts(data)))
+
+    def _on_kline(
+        self,
+        data: dict[str, Any],
+        ticks: list[WsTick],
+        kline_ticks: list[WsKlineTick],
+    ) -> None:
+        symbol = str(data.get("s", "")).upper()
+        if not symbol:
+            return
+        kline_data = data.get("k", {})
+        open_time = kline_data.get("t")
+        if not isinstance(open_time, int):
+            return
         try:
-            return json.loads(raw)
-        except Exception:  # noqa: BLE001
-            return None
+            candle = Candle(
+                open=float(kline_data["o"]),
+                high=float(kline_data["h"]),
+                low=float(kline_data["l"]),
+                close=float(kline_data["c"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return
+        kline_ticks.append(
+            WsKlineTick(
+                symbol=symbol,
+                candle=candle,
+                open_time_ms=open_time,
+                is_closed=bool(kline_data.get("x", False)),
+                ts=self._event_ts(data),
+            )
+        )
 
     @staticmethod
-    def _to_float(value: Any) -> float | None:
-        if value is None:
+    def _side_price(raw: Any) -> float | None:
+        if not raw:
             return None
         try:
-            return float(value)
+            return float(raw)
         except (TypeError, ValueError):
             return None
 
-    def _kline_to_candle(self, payload: dict[str, Any]) -> Candle | None:
-        open_ = self._to_float(payload.get("o"))
-        high = self._to_float(payload.get("h"))
-        low = self._to_float(payload.get("l"))
-        close = self._to_float(payload.get("c"))
-        if None in (open_, high, low, close):
+    @staticmethod
+    def _safe_parse(raw: Any) -> dict[str, Any] | None:
+        try:
+            return _json_loads(raw)
+        except Exception:  # noqa: BLE001
             return None
-        return Candle(open=open_, high=high, low=low, close=close)
 
     @staticmethod
     def _event_ts(data: dict[str, Any]) -> datetime:
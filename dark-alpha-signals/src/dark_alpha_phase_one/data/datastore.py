@@ -1,24 +1,43 @@
 from __future__ import annotations
 
+import sys
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from threading import RLock
 
+try:
+    from orjson import dumps as _json_dumps
+except ImportError:  # orjson is an optional accelerator; stdlib json works too
+    import json as _json
+
+    def _json_dumps(obj: object) -> bytes:
+        return _json.dumps(obj, separators=(",", ":")).encode()
+
+
 from dark_alpha_phase_one.calculations import Candle
 
+# Hoisted once for the mutator hot paths; datetime.now / timezone.utc are
+# otherwise re-resolved on every update.
+_UTC = timezone.utc
+_now = datetime.now
+
 
-@dataclass(frozen=True)
+def _ts_ms(ts: datetime | None) -> int | None:
+    return None if ts is None else int(ts.timestamp() * 1000)
+
+
+@dataclass(frozen=True, slots=True)
 class FundingRatePoint:
     funding_rate: float
     funding_time: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SymbolSnapshot:
     symbol: str
     price: float | None
-    klines_1m: list[Candle]
+    klines_1m: tuple[Candle, ...]
     last_price_ts: datetime | None
     last_kline_close_ts: datetime | None
     last_kline_recv_ts: datetime | None
@@ -26,61 +45,151 @@ class SymbolSnapshot:
     last_funding_rate: float | None
     next_funding_time_ms: int | None
     mark_price: float | None
-    funding_rate_history: list[FundingRatePoint]
+    funding_rate_history: tuple[FundingRatePoint, ...]
     open_interest: float | None
     open_interest_ts: datetime | None
     funding_ts: datetime | None
-    open_interest_series: list[tuple[datetime, float]]
+    open_interest_series: tuple[tuple[datetime, float], ...]
+
+
+class _SymbolState:
+    # All per-symbol fields live on one slots object, so every operation
+    # pays a single symbol-keyed dict lookup instead of one per field.
+    __slots__ = (
+        "lock",
+        "price_ts",
+        "price_val",
+        "klines",
+        "last_price_ts",
+        "last_kline_close_ts",
+        "last_kline_recv_ts",
+        "last_ws_kline_open_time",
+        "pending_candle",
+        "pending_open_time",
+        "last_funding_rate",
+        "next_funding_time_ms",
+        "mark_price",
+        "funding_rate_history",
+        "funding_view",
+        "funding_dirty",
+        "open_interest",
+        "open_interest_ts",
+        "funding_ts",
+        "open_interest_series",
+        "klines_view",
+        "klines_dirty",
+        "oi_series_view",
+        "oi_series_dirty",
+        "snapshot_cache",
+    )
+
+    def __init__(self, max_price_points: int, max_klines: int) -> None:
+        self.lock = RLock()
+        # Parallel deques avoid boxing a (ts, price) 2-tuple per tick.
+        self.price_ts: deque[datetime] = deque(maxlen=max_price_points)
+        self.price_val: deque[float] = deque(maxlen=max_price_points)
+        self.klines: deque[Candle] = deque(maxlen=max_klines)
+        self.last_price_ts: datetime | None = None
+        self.last_kline_close_ts: datetime | None = None
+        self.last_kline_recv_ts: datetime | None = None
+        self.last_ws_kline_open_time: int | None = None
+        # Latest mid-candle WS partial, coalesced outside the deque: only
+        # the closing update touches the klines buffer, snapshots merge the
+        # pending candle on the fly.
+        self.pending_candle: Candle | None = None
+        self.pending_open_time: int | None = None
+        self.last_funding_rate: float | None = None
+        self.next_funding_time_ms: int | None = None
+        self.mark_price: float | None = None
+        self.funding_rate_history: deque[FundingRatePoint] = deque(maxlen=1024)
+        self.open_interest: float | None = None
+        self.open_interest_ts: datetime | None = None
+        self.funding_ts: datetime | None = None
+        self.open_interest_series: deque[tuple[datetime, float]] = deque(maxlen=24 * 60 * 6)
+
+        # Copy-on-write snapshot views: the tuple copies below are rebuilt
+        # only after a mutation, so steady-state snapshot() is O(1) and the
+        # immutable tuples are safe to share across readers.
+        self.klines_view: tuple[Candle, ...] = ()
+        self.klines_dirty = False
+        self.oi_series_view: tuple[tuple[datetime, float], ...] = ()
+        self.oi_series_dirty = False
+        self.funding_view: tuple[FundingRatePoint, ...] = ()
+        self.funding_dirty = False
+
+        # Fully built snapshot, atomically swapped by mutators (set to None
+        # to invalidate). Readers that find it non-None take it lock-free.
+        self.snapshot_cache: SymbolSnapshot | None = None
 
 
 class DataStore:
     def __init__(self, symbols: list[str], max_price_points: int = 600, max_klines: int = 1440) -> None:
-        self._lock = RLock()
-        self._mode = "rest"
-        self._prices: dict[str, deque[tuple[datetime, float]]] = {
-            symbol: deque(maxlen=max_price_points) for symbol in symbols
-        }
-        self._klines: dict[str, deque[Candle]] = {symbol: deque(maxlen=max_klines) for symbol in symbols}
-        self._last_price_ts: dict[str, datetime | None] = {symbol: None for symbol in symbols}
-        self._last_kline_close_ts: dict[str, datetime | None] = {symbol: None for symbol in symbols}
-        self._last_kline_recv_ts: dict[str, datetime | None] = {symbol: None for symbol in symbols}
-        self._last_ws_kline_open_time: dict[str, int | None] = {symbol: None for symbol in symbols}
-
-        self._last_funding_rate: dict[str, float | None] = {symbol: None for symbol in symbols}
-        self._next_funding_time_ms: dict[str, int | None] = {symbol: None for symbol in symbols}
-        self._mark_price: dict[str, float | None] = {symbol: None for symbol in symbols}
-        self._funding_rate_history: dict[str, list[FundingRatePoint]] = {symbol: [] for symbol in symbols}
-        self._open_interest: dict[str, float | None] = {symbol: None for symbol in symbols}
-        self._open_interest_ts: dict[str, datetime | None] = {symbol: None for symbol in symbols}
-        self._funding_ts: dict[str, datetime | None] = {symbol: None for symbol in symbols}
-        self._open_interest_series: dict[str, deque[tuple[datetime, float]]] = {
-            symbol: deque(maxlen=24 * 60 * 6) for symbol in symbols
+        # One lock per symbol (held on its state object): WS ingest and
+        # snapshot readers on different symbols never contend. _mode is the
+        # only cross-symbol field and keeps its own small lock.
+        # Interned keys make the per-operation dict lookups an identity
+        # comparison when callers pass the same interned strings (the
+        # settings symbols are literals, which CPython interns already).
+        self._state: dict[str, _SymbolState] = {
+            sys.intern(symbol): _SymbolState(max_price_points, max_klines) for symbol in symbols
         }
+        self._mode_lock = RLock()
+        self._mode = "rest"
 
     def set_mode(self, mode: str) -> None:
-        with self._lock:
-            self._mode = mode
+        with self._mode_lock:
+            if mode != self._mode:
+                self._mode = mode
+                # Snapshots embed the mode, so a mode flip invalidates all.
+                for state in self._state.values():
+                    state.snapshot_cache = None
 
     def mode(self) -> str:
-        with self._lock:
+        with self._mode_lock:
             return self._mode
 
     def update_price(self, symbol: str, price: float, ts: datetime | None = None) -> None:
-        ts = ts or datetime.now(tz=timezone.utc)
-        with self._lock:
-            self._prices[symbol].append((ts, price))
-            self._last_price_ts[symbol] = ts
+        if ts is None:
+            ts = _now(_UTC)
+        state = self._state[symbol]
+        with state.lock:
+            state.price_ts.append(ts)
+            state.price_val.append(price)
+            state.last_price_ts = ts
+            state.snapshot_cache = None
+
+    def update_prices(self, updates: list[tuple[str, float]], ts: datetime | None = None) -> None:
+        # Batch form of update_price for WS bursts: one lock round-trip and
+        # one cache invalidation per symbol instead of per tick.
+        if ts is None:
+            ts = _now(_UTC)
+        grouped: dict[str, list[float]] = {}
+        for symbol, price in updates:
+            grouped.setdefault(symbol, []).append(price)
+        for symbol, prices in grouped.items():
+            state = self._state[symbol]
+            with state.lock:
+                state.price_ts.extend([ts] * len(prices))
+                state.price_val.extend(prices)
+                state.last_price_ts = ts
+                state.snapshot_cache = None
 
     def merge_klines(self, symbol: str, klines: list[Candle], ts: datetime | None = None) -> None:
-        ts = ts or datetime.now(tz=timezone.utc)
-        with self._lock:
+        if ts is None:
+            ts = _now(_UTC)
+        state = self._state[symbol]
+        with state.lock:
             if not klines:
                 return
-            self._klines[symbol].clear()
-            self._klines[symbol].extend(klines)
-            self._last_kline_close_ts[symbol] = ts
-            self._last_kline_recv_ts[symbol] = ts
-            self._last_ws_kline_open_time[symbol] = None
+            state.klines.clear()
+            state.klines.extend(klines)
+            state.klines_dirty = True
+            state.pending_candle = None
+            state.pending_open_time = None
+            state.last_kline_close_ts = ts
+            state.last_kline_recv_ts = ts
+            state.last_ws_kline_open_time = None
+            state.snapshot_cache = None
 
     def upsert_ws_kline(
         self,
@@ -90,18 +199,31 @@ class DataStore:
         is_closed: bool,
         ts: datetime | None = None,
     ) -> None:
-        ts = ts or datetime.now(tz=timezone.utc)
-        with self._lock:
-            last_open = self._last_ws_kline_open_time[symbol]
-            if self._klines[symbol] and last_open == open_time_ms:
-                self._klines[symbol][-1] = candle
-            else:
-                self._klines[symbol].append(candle)
-                self._last_ws_kline_open_time[symbol] = open_time_ms
+        if ts is None:
+            ts = _now(_UTC)
+        state = self._state[symbol]
+        with state.lock:
+            if not is_closed:
+                # 10+ partials per second per symbol only ever matter in
+                # their latest form: stash the candle and skip the deque
+                # and view churn until the close (or a snapshot) needs it.
+                state.pending_candle = candle
+                state.pending_open_time = open_time_ms
+                state.last_kline_recv_ts = ts
+                state.snapshot_cache = None
+                return
 
-            self._last_kline_recv_ts[symbol] = ts
-            if is_closed:
-                self._last_kline_close_ts[symbol] = ts
+            if state.klines and state.last_ws_kline_open_time == open_time_ms:
+                state.klines[-1] = candle
+            else:
+                state.klines.append(candle)
+                state.last_ws_kline_open_time = open_time_ms
+            state.klines_dirty = True
+            state.pending_candle = None
+            state.pending_open_time = None
+            state.last_kline_recv_ts = ts
+            state.last_kline_close_ts = ts
+            state.snapshot_cache = None
 
     def update_premium_index(
         self,
@@ -112,12 +234,15 @@ class DataStore:
         next_funding_time_ms: int,
         ts: datetime | None = None,
     ) -> None:
-        ts = ts or datetime.now(tz=timezone.utc)
-        with self._lock:
-            self._mark_price[symbol] = mark_price
-            self._last_funding_rate[symbol] = last_funding_rate
-            self._next_funding_time_ms[symbol] = next_funding_time_ms
-            self._funding_ts[symbol] = ts
+        if ts is None:
+            ts = _now(_UTC)
+        state = self._state[symbol]
+        with state.lock:
+            state.mark_price = mark_price
+            state.last_funding_rate = last_funding_rate
+            state.next_funding_time_ms = next_funding_time_ms
+            state.funding_ts = ts
+            state.snapshot_cache = None
 
     def update_funding_rate_history(
         self,
@@ -125,39 +250,136 @@ class DataStore:
         history: list[FundingRatePoint],
         ts: datetime | None = None,
     ) -> None:
-        ts = ts or datetime.now(tz=timezone.utc)
-        with self._lock:
-            self._funding_rate_history[symbol] = history
-            self._funding_ts[symbol] = ts
+        if ts is None:
+            ts = _now(_UTC)
+        state = self._state[symbol]
+        with state.lock:
+            # Full-replace fallback: clear + extend mutates in place instead
+            # of rebinding, so the deque (and its maxlen) survive.
+            state.funding_rate_history.clear()
+            state.funding_rate_history.extend(history)
+            state.funding_dirty = True
+            state.funding_ts = ts
+            state.snapshot_cache = None
+
+    def append_funding_rate_point(
+        self,
+        symbol: str,
+        point: FundingRatePoint,
+        ts: datetime | None = None,
+    ) -> None:
+        # Incremental fast path: history arrives in funding_time order, so a
+        # single tail comparison replaces the full-list rebuild when only the
+        # newest point is fresh.
+        if ts is None:
+            ts = _now(_UTC)
+        state = self._state[symbol]
+        with state.lock:
+            history = state.funding_rate_history
+            if history and point.funding_time <= history[-1].funding_time:
+                return
+            history.append(point)
+            state.funding_dirty = True
+            state.funding_ts = ts
+            state.snapshot_cache = None
 
     def update_open_interest(self, symbol: str, open_interest: float, ts: datetime | None = None) -> None:
-        ts = ts or datetime.now(tz=timezone.utc)
-        with self._lock:
-            self._open_interest[symbol] = open_interest
-            self._open_interest_ts[symbol] = ts
-            self._open_interest_series[symbol].append((ts, open_interest))
+        if ts is None:
+            ts = _now(_UTC)
+        state = self._state[symbol]
+        with state.lock:
+            state.open_interest = open_interest
+            state.open_interest_ts = ts
+            state.open_interest_series.append((ts, open_interest))
+            state.oi_series_dirty = True
+            state.snapshot_cache = None
 
     def snapshot(self, symbol: str) -> SymbolSnapshot:
-        with self._lock:
-            latest_price = self._prices[symbol][-1][1] if self._prices[symbol] else None
-            return SymbolSnapshot(
+        state = self._state[symbol]
+        cached = state.snapshot_cache
+        if cached is not None:
+            return cached
+        with state.lock:
+            if state.klines_dirty:
+                state.klines_view = tuple(state.klines)
+                state.klines_dirty = False
+            if state.oi_series_dirty:
+                state.oi_series_view = tuple(state.open_interest_series)
+                state.oi_series_dirty = False
+            if state.funding_dirty:
+                state.funding_view = tuple(state.funding_rate_history)
+                state.funding_dirty = False
+            latest_price = state.price_val[-1] if state.price_val else None
+            klines = state.klines_view
+            if state.pending_candle is not None:
+                if klines and state.last_ws_kline_open_time == state.pending_open_time:
+                    klines = klines[:-1] + (state.pending_candle,)
+                else:
+                    klines = klines + (state.pending_candle,)
+            snap = SymbolSnapshot(
                 symbol=symbol,
                 price=latest_price,
-                klines_1m=list(self._klines[symbol]),
-                last_price_ts=self._last_price_ts[symbol],
-                last_kline_close_ts=self._last_kline_close_ts[symbol],
-                last_kline_recv_ts=self._last_kline_recv_ts[symbol],
+                klines_1m=klines,
+                last_price_ts=state.last_price_ts,
+                last_kline_close_ts=state.last_kline_close_ts,
+                last_kline_recv_ts=state.last_kline_recv_ts,
                 data_source_mode=self._mode,
-                last_funding_rate=self._last_funding_rate[symbol],
-                next_funding_time_ms=self._next_funding_time_ms[symbol],
-                mark_price=self._mark_price[symbol],
-                funding_rate_history=list(self._funding_rate_history[symbol]),
-                open_interest=self._open_interest[symbol],
-                open_interest_ts=self._open_interest_ts[symbol],
-                funding_ts=self._funding_ts[symbol],
-                open_interest_series=list(self._open_interest_series[symbol]),
+                last_funding_rate=state.last_funding_rate,
+                next_funding_time_ms=state.next_funding_time_ms,
+                mark_price=state.mark_price,
+                funding_rate_history=state.funding_view,
+                open_interest=state.open_interest,
+                open_interest_ts=state.open_interest_ts,
+                funding_ts=state.funding_ts,
+                open_interest_series=state.oi_series_view,
             )
+            state.snapshot_cache = snap
+            return snap
+
+    def snapshot_all(self) -> list[SymbolSnapshot]:
+        # Batched form for polling loops: one pass over the state dict
+        # instead of a string-keyed lookup per symbol.
+        return [self.snapshot(symbol) for symbol in self._state]
+
+    def snapshot_bytes(self, symbol: str) -> bytes:
+        # Wire form for dashboards/IPC: primitives only (ms epoch ints, OHLC
+        # rows), so the consumer's next JSON hop never walks the dataclass
+        # graph. Built from the cached snapshot, so steady state is one
+        # serializer call.
+        snap = self.snapshot(symbol)
+        return _json_dumps(
+            {
+                "symbol": snap.symbol,
+                "price": snap.price,
+                "klines_1m": [[c.open, c.high, c.low, c.close] for c in snap.klines_1m],
+                "last_price_ts_ms": _ts_ms(snap.last_price_ts),
+                "last_kline_close_ts_ms": _ts_ms(snap.last_kline_close_ts),
+                "last_kline_recv_ts_ms": _ts_ms(snap.last_kline_recv_ts),
+                "data_source_mode": snap.data_source_mode,
+                "last_funding_rate": snap.last_funding_rate,
+                "next_funding_time_ms": snap.next_funding_time_ms,
+                "mark_price": snap.mark_price,
+                "funding_rate_history": [
+                    [p.funding_rate, p.funding_time] for p in snap.funding_rate_history
+                ],
+                "open_interest": snap.open_interest,
+                "open_interest_ts_ms": _ts_ms(snap.open_interest_ts),
+                "funding_ts_ms": _ts_ms(snap.funding_ts),
+                "open_interest_series": [[_ts_ms(ts), oi] for ts, oi in snap.open_interest_series],
+            }
+        )
+
+    def timestamps(self, symbol: str) -> tuple[int | None, int | None]:
+        # Staleness-only view: (last_price_ms, last_kline_recv_ms) without
+        # forcing a snapshot rebuild after a write invalidated the cache.
+        state = self._state[symbol]
+        with state.lock:
+            return _ts_ms(state.last_price_ts), _ts_ms(state.last_kline_recv_ts)
 
     def buffer_sizes(self, symbol: str) -> tuple[int, int]:
-        with self._lock:
-            return len(self._prices[symbol]), len(self._klines[symbol])
+        state = self._state[symbol]
+        with state.lock:
+            return len(state.price_val), len(state.klines)
+
+    def buffer_sizes_all(self) -> dict[str, tuple[int, int]]:
+        return {symbol: self.buffer_sizes(symbol) for symbol in self._state}
@@ -1,17 +1,52 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import logging
+import random
 import time
 from typing import Protocol
 
 from dark_alpha_phase_one.data.datastore import DataStore
 
+# Poll deadlines are integer nanoseconds from time.monotonic_ns: integer
+# compares, immune to float accumulation over long uptimes.
+_SECOND_NS = 1_000_000_000
+_HEALTH_LOG_INTERVAL_NS = 60 * _SECOND_NS
+
+# time.time_ns keeps the epoch read in integer space: no float multiply,
+# no 53-bit precision detour on the way to milliseconds.
+_time_ns = time.time_ns
+
+# Health heartbeat format, hoisted to module scope: the template is long
+# enough that keeping it out of the method keeps the call site readable.
+_HEALTH_LOG_FMT = (
+    "health mode=%s symbol=%s now_ms_corrected=%d clock_skew_ms=%d clock_state=%s drift_ms=%s drift_ms_source=%s last_server_sync_age_ms=%s last_force_refresh_age_ms=%s refresh_cooldown_remaining_ms=%s "
+    "last_price_ts_ms=%s last_kline_close_ts_ms=%s last_kline_recv_ts_ms=%s funding_ts_ms=%s open_interest_ts_ms=%s "
+    "last_price_raw_age_ms=%s last_kline_close_raw_age_ms=%s last_kline_recv_raw_age_ms=%s funding_raw_age_ms=%s oi_raw_age_ms=%s "
+    "last_price_age_seconds=%s last_kline_age_seconds=%s last_kline_recv_age_seconds=%s funding_age_seconds=%s oi_age_seconds=%s "
+    "price_buffer=%d kline_buffer=%d"
+)
+
+# Cached root logger: the module-level logging helpers re-resolve
+# getLogger() on every call, and the health path wants a cheap
+# isEnabledFor probe.
+_LOGGER = logging.getLogger()
+
 
 class RestClientProtocol(Protocol):
+    """REST data source.
+
+    Implementations are expected to reuse one persistent HTTP session
+    (keep-alive) across fetches; the manager fires many small GETs per
+    refresh and a handshake per call would dominate poll latency.
+    """
+
     def fetch_price(self, symbol: str): ...
 
+    def fetch_prices(self, symbols: list[str]): ...
+
     def fetch_klines(self, symbol: str, limit: int): ...
 
     def fetch_premium_index(self, symbol: str): ...
@@ -33,7 +68,7 @@ class WsClientProtocol(Protocol):
     def read_events(self) -> tuple[list, list]: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ClockSyncState:
     clock_skew_ms: int = 0
     last_server_ms: int | None = None
@@ -75,8 +110,9 @@ class ClockSync:
 
     def _transition_state(self, new_state: str, reason: str) -> None:
         old_state = self.state.state
-        if old_state != new_state:
-            logging.info("event=clock_state_change from=%s to=%s reason=%s", old_state, new_state, reason)
+        if old_state == new_state:
+            return
+        _LOGGER.info("event=clock_state_change from=%s to=%s reason=%s", old_state, new_state, reason)
         self.state.state = new_state
 
     def _set_next_refresh(self, now_mono: float) -> None:
@@ -90,7 +126,7 @@ class ClockSync:
             self.state.last_drift_source = "skipped_no_new_server_time"
             return self.state.state == "synced"
 
-        local_ms = int(time.time() * 1000)
+        local_ms = _time_ns() // 1_000_000
         start = time.perf_counter()
         try:
             server_ms = self.rest_client.fetch_server_time_ms()
@@ -117,7 +153,7 @@ class ClockSync:
                 if cooldown_remaining_ms > 0:
                     self._transition_state("degraded", "cooldown_blocked")
                     self.state.degraded_until_local_ms = local_ms + self.degraded_ttl_ms
-                    logging.warning(
+                    _LOGGER.warning(
                         "event=clock_sanity_fallback unit=ms local_ms=%d server_ms=%d skew_ms=%d now_ms_corrected=%d drift_ms=%d max_clock_error_ms=%d action=degrade cooldown_remaining_ms=%d",
                         local_ms,
                         server_ms,
@@ -129,7 +165,7 @@ class ClockSync:
                     )
                 else:
                     self.state.last_force_refresh_local_ms = local_ms
-                    logging.warning(
+                    _LOGGER.warning(
                         "event=clock_sanity_fallback unit=ms local_ms=%d server_ms=%d skew_ms=%d now_ms_corrected=%d drift_ms=%d max_clock_error_ms=%d action=force_refresh",
                         local_ms,
                         server_ms,
@@ -153,7 +189,7 @@ class ClockSync:
                 self.state.degraded_until_local_ms = None
 
             self._set_next_refresh(now_mono)
-            logging.info(
+            _LOGGER.info(
                 "event=server_time_refresh result=success unit=ms latency_ms=%d local_ms=%d server_ms=%d skew_ms=%d now_ms_corrected=%d clock_state=%s http_status=na",
                 latency_ms,
                 local_ms,
@@ -173,7 +209,7 @@ class ClockSync:
             self.state.last_drift_ms = None
             self.state.last_drift_source = "skipped_no_new_server_time"
             self._set_next_refresh(now_mono)
-            logging.warning(
+            _LOGGER.warning(
                 "event=server_time_refresh result=fail unit=ms latency_ms=%d local_ms=%d server_ms=na skew_ms=na clock_state=%s http_status=na error=%s",
                 latency_ms,
                 local_ms,
@@ -183,8 +219,16 @@ class ClockSync:
             return False
 
     def now_ms(self) -> int:
+        # Steady-state fast path: synced with no refresh due reduces to one
+        # time.time() read plus the skew addition, skipping the
+        # refresh_server_time call (and its monotonic read) entirely.
+        if self.state.state == "synced" and time.monotonic() < self._next_refresh_mono:
+            self.state.last_drift_ms = None
+            self.state.last_drift_source = "skipped_no_new_server_time"
+            return _time_ns() // 1_000_000 + self.state.clock_skew_ms
+
         self.refresh_server_time(force=False)
-        local_ms = int(time.time() * 1000)
+        local_ms = _time_ns() // 1_000_000
 
         if self.state.state == "degraded":
             if self.state.last_force_refresh_local_ms is None:
@@ -194,7 +238,7 @@ class ClockSync:
                 return local_ms
             self.state.last_force_refresh_local_ms = local_ms
             if self.refresh_server_time(force=True):
-                refreshed_local_ms = int(time.time() * 1000)
+                refreshed_local_ms = _time_ns() // 1_000_000
                 return self.compute_now_ms_corrected(
                     local_ms=refreshed_local_ms,
                     clock_skew_ms=self.state.clock_skew_ms,
@@ -234,34 +278,61 @@ class SourceManager:
         clock_refresh_cooldown_ms: int = 30000,
         clock_degraded_ttl_ms: int = 60000,
     ) -> None:
-        self.symbols = symbols
+        # Never mutated after init; a tuple iterates without the list's
+        # size-change checks and is safely shareable.
+        self.symbols = tuple(symbols)
         self.datastore = datastore
         self.rest_client = rest_client
         self.ws_client = ws_client
         self.preferred_mode = preferred_mode
         self.stale_seconds = stale_seconds
+        self._stale_ms = stale_seconds * 1000
         self.kline_stale_ms = kline_stale_ms if kline_stale_ms is not None else kline_stale_seconds * 1000
         self.ws_backoff_min = ws_backoff_min
         self.ws_backoff_max = ws_backoff_max
         self.rest_price_poll_seconds = rest_price_poll_seconds
         self.rest_kline_poll_seconds = rest_kline_poll_seconds
+        self._rest_price_poll_ns = int(rest_price_poll_seconds * _SECOND_NS)
+        self._rest_kline_poll_ns = int(rest_kline_poll_seconds * _SECOND_NS)
         self.ws_recover_good_ticks = ws_recover_good_ticks
         self.state_sync_klines = state_sync_klines
         self.premiumindex_poll_seconds = premiumindex_poll_seconds
         self.funding_poll_seconds = funding_poll_seconds
         self.oi_poll_seconds = oi_poll_seconds
         self.funding_history_limit = funding_history_limit
+        self._premium_poll_ns = int(premiumindex_poll_seconds * _SECOND_NS)
+        self._funding_poll_ns = int(funding_poll_seconds * _SECOND_NS)
+        self._oi_poll_ns = int(oi_poll_seconds * _SECOND_NS)
 
         self._mode = "ws" if preferred_mode == "ws" else "rest"
         self._ws_good_ticks = 0
-        self._last_rest_price_poll = 0.0
-        self._last_rest_kline_poll = 0.0
-        self._last_premium_poll = 0.0
-        self._last_funding_poll = 0.0
-        self._last_oi_poll = 0.0
-        self._last_health_log = 0.0
+        self._last_rest_price_poll = 0
+        self._last_rest_kline_poll = 0
+        self._last_premium_poll = 0
+        self._last_funding_poll = 0
+        self._last_oi_poll = 0
+        self._last_health_log = 0
         self._ws_backoff = ws_backoff_min
-        self._ws_next_retry_at = 0.0
+        self._ws_next_retry_at = 0
+
+        # Per-tick clock cache: refresh() reads the corrected clock once and
+        # every callee shares it, instead of O(symbols) now_ms()/datetime
+        # constructions per cycle.
+        self._tick_now_ms: int | None = None
+        self._tick_now_dt: datetime | None = None
+        # Symbols whose price/kline timestamps were written this tick with
+        # fresh WS data; _evaluate_staleness skips the matching checks since
+        # their age is zero by construction.
+        self._tick_fresh_price: set[str] = set()
+        self._tick_fresh_kline: set[str] = set()
+
+        # REST fan-out pool: per-symbol fetches run concurrently so poll
+        # wall-clock time stays ~1 RTT instead of N_symbols x RTT. Results
+        # are applied on the refresh thread, keeping datastore writes there.
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=min(32, max(1, len(symbols))),
+            thread_name_prefix="source-rest",
+        )
 
         self._clock = ClockSync(
             rest_client=rest_client,
@@ -272,6 +343,12 @@ class SourceManager:
             degraded_ttl_ms=clock_degraded_ttl_ms,
         )
 
+        if not (hasattr(rest_client, "session") or hasattr(rest_client, "_client")):
+            _LOGGER.warning(
+                "rest_client %s exposes no session attribute; REST polls may pay a TCP/TLS handshake per call",
+                type(rest_client).__name__,
+            )
+
         self.datastore.set_mode(self._mode)
         self._clock.refresh_server_time(force=True)
         self._safe_state_sync(reason="bootstrap")
@@ -307,39 +384,62 @@ class SourceManager:
         return raw_age_ms / 1000.0
 
     def now_ms_corrected(self) -> int:
+        if self._tick_now_ms is not None:
+            return self._tick_now_ms
         return self._clock.now_ms()
 
     def _now_dt_corrected(self) -> datetime:
-        return datetime.fromtimestamp(self.now_ms_corrected() / 1000, tz=timezone.utc)
+        if self._tick_now_dt is not None:
+            return self._tick_now_dt
+        return datetime.fromtimestamp(self._clock.now_ms() / 1000, tz=timezone.utc)
 
     def _connect_ws(self, *, initial: bool = False) -> None:
         try:
             self.ws_client.connect()
             if initial:
-                logging.info("WS initial connect ok")
+                _LOGGER.info("WS initial connect ok")
         except Exception as exc:  # noqa: BLE001
             self._mode = "rest"
             self.datastore.set_mode("rest")
-            self._ws_next_retry_at = time.monotonic() + self._ws_backoff
-            self._ws_backoff = min(self._ws_backoff * 2, self.ws_backoff_max)
-            logging.warning("WS initial connect failed, fallback to rest: %s", exc)
+            self._schedule_ws_retry(time.monotonic_ns())
+            _LOGGER.warning("WS initial connect failed, fallback to rest: %s", exc)
+
+    def _schedule_ws_retry(self, now_mono_ns: int) -> None:
+        # Server-initiated overload (1012 Service Restart / 1013 Try Again
+        # Later) jumps straight to the maximum delay instead of crawling up.
+        close_code = getattr(self.ws_client, "last_close_code", None)
+        if close_code in (1012, 1013):
+            self._ws_backoff = self.ws_backoff_max
+            _LOGGER.warning("WS close code %d: backing off to max %ds", close_code, self.ws_backoff_max)
+        # +/-25% jitter on the retry delay decorrelates reconnect storms
+        # when several instances share the same upstream gateway.
+        self._ws_next_retry_at = now_mono_ns + int(self._ws_backoff * random.uniform(0.75, 1.25) * _SECOND_NS)
+        self._ws_backoff = min(self._ws_backoff * 2, self.ws_backoff_max)
 
     def current_mode(self) -> str:
         return self._mode
 
     def refresh(self) -> None:
-        now_mono = time.monotonic()
-
-        self._attempt_ws_events()
-        self._evaluate_staleness()
-        self._poll_derivatives(now_mono)
+        now_mono_ns = time.monotonic_ns()
+        self._tick_fresh_price.clear()
+        self._tick_fresh_kline.clear()
+        self._tick_now_ms = self._clock.now_ms()
+        self._tick_now_dt = datetime.fromtimestamp(self._tick_now_ms / 1000, tz=timezone.utc)
+        try:
+            self._attempt_ws_events()
+            self._evaluate_staleness()
+            self._poll_derivatives(now_mono_ns)
 
-        if self._mode == "rest":
-            self._poll_rest_prices(now_mono)
-            self._poll_rest_klines(now_mono)
-            self._attempt_ws_recover(now_mono)
+            if self._mode == "rest":
+                self._poll_rest_prices(now_mono_ns)
+                self._poll_rest_klines(now_mono_ns)
+                self._attempt_ws_recover(now_mono_ns)
 
-        self._log_health_if_needed(now_mono)
+            self._log_health_if_needed(now_mono_ns)
+        finally:
+            # Callers outside the tick still get fresh values.
+            self._tick_now_ms = None
+            self._tick_now_dt = None
 
     def _attempt_ws_events(self) -> None:
         if self._mode != "ws" or not self.ws_client.connected:
@@ -352,16 +452,28 @@ class SourceManager:
             self.ws_client.close()
 
     def _apply_ws_events(self, ticks: list, kline_ticks: list) -> int:
-        fresh_ticks = 0
+        if not ticks and not kline_ticks:
+            return 0
+
         now_dt = self._now_dt_corrected()
         now_ms = self.now_ms_corrected()
-        for tick in ticks:
-            self.datastore.update_price(tick.symbol, tick.price, now_dt)
-            raw_age = self.raw_age_ms(now_ms, self.dt_to_ms(now_dt))
-            if raw_age is not None and raw_age <= self.stale_seconds * 1000:
-                fresh_ticks += 1
+        # Every tick in this batch shares now_dt, so the freshness test is
+        # one computation, not one per tick.
+        raw_age = self.raw_age_ms(now_ms, self.dt_to_ms(now_dt))
+        batch_is_fresh = raw_age is not None and raw_age <= self._stale_ms
+
+        if ticks:
+            # One batched call groups ticks per symbol inside the store, so
+            # a burst costs one lock acquisition per symbol, not per tick.
+            self.datastore.update_prices([(tick.symbol, tick.price) for tick in ticks], now_dt)
+        fresh_ticks = len(ticks) if batch_is_fresh else 0
+        if batch_is_fresh:
+            self._tick_fresh_price.update(tick.symbol for tick in ticks)
+            self._tick_fresh_kline.update(kline_tick.symbol for kline_tick in kline_ticks)
+
+        upsert_ws_kline = self.datastore.upsert_ws_kline
         for kline_tick in kline_ticks:
-            self.datastore.upsert_ws_kline(
+            upsert_ws_kline(
                 kline_tick.symbol,
                 kline_tick.candle,
                 kline_tick.open_time_ms,
@@ -370,61 +482,110 @@ class SourceManager:
             )
         return fresh_ticks
 
-    def _poll_derivatives(self, now_mono: float) -> None:
-        if now_mono - self._last_premium_poll >= self.premiumindex_poll_seconds:
-            for symbol in self.symbols:
-                try:
-                    mark, funding_rate, next_funding_ms, _ = self.rest_client.fetch_premium_index(symbol)
-                    self.datastore.update_premium_index(
-                        symbol,
-                        mark_price=mark,
-                        last_funding_rate=funding_rate,
-                        next_funding_time_ms=next_funding_ms,
-                        ts=self._now_dt_corrected(),
-                    )
-                except Exception as exc:  # noqa: BLE001
-                    logging.warning("premiumIndex poll failed for %s: %s", symbol, exc)
-            self._last_premium_poll = now_mono
-
-        if now_mono - self._last_funding_poll >= self.funding_poll_seconds:
-            for symbol in self.symbols:
-                try:
-                    history, _ = self.rest_client.fetch_funding_rate_history(
-                        symbol,
-                        limit=self.funding_history_limit,
-                    )
-                    self.datastore.update_funding_rate_history(symbol, history, self._now_dt_corrected())
-                except Exception as exc:  # noqa: BLE001
-                    logging.warning("fundingRate poll failed for %s: %s", symbol, exc)
-            self._last_funding_poll = now_mono
-
-        if now_mono - self._last_oi_poll >= self.oi_poll_seconds:
-            for symbol in self.symbols:
-                try:
-                    oi, _ = self.rest_client.fetch_open_interest(symbol)
-                    self.datastore.update_open_interest(symbol, oi, self._now_dt_corrected())
-                except Exception as exc:  # noqa: BLE001
-                    logging.warning("openInterest poll failed for %s: %s", symbol, exc)
-            self._last_oi_poll = now_mono
-
-    def _poll_rest_prices(self, now_mono: float) -> None:
-        if now_mono - self._last_rest_price_poll < self.rest_price_poll_seconds:
+    def _submit_per_symbol(self, fetch) -> list[tuple[str, Future]]:
+        return [(symbol, self._io_pool.submit(fetch, symbol)) for symbol in self.symbols]
+
+    def _poll_derivatives(self, now_mono_ns: int) -> None:
+        # Table-driven scheduler: gather every due poll first so all of
+        # their per-symbol fetches go to the pool in one wave, then apply
+        # results on this thread.
+        due: list[tuple[str, object, object]] = []
+        if now_mono_ns - self._last_premium_poll >= self._premium_poll_ns:
+            fetch_premium_all = getattr(self.rest_client, "fetch_premium_index_all", None)
+            if fetch_premium_all is not None:
+                # One round-trip covers every symbol; fall back to the
+                # per-symbol fan-out only when the batch call fails.
+                if self._poll_premium_batch(fetch_premium_all):
+                    self._last_premium_poll = now_mono_ns
+                else:
+                    due.append(("_last_premium_poll", self.rest_client.fetch_premium_index, self._apply_premium_index))
+            else:
+                due.append(("_last_premium_poll", self.rest_client.fetch_premium_index, self._apply_premium_index))
+        if now_mono_ns - self._last_funding_poll >= self._funding_poll_ns:
+            fetch_funding = lambda s: self.rest_client.fetch_funding_rate_history(s, limit=self.funding_history_limit)  # noqa: E731
+            due.append(("_last_funding_poll", fetch_funding, self._apply_funding_history))
+        if now_mono_ns - self._last_oi_poll >= self._oi_poll_ns:
+            due.append(("_last_oi_poll", self.rest_client.fetch_open_interest, self._apply_open_interest))
+        if not due:
             return
-        for symbol in self.symbols:
-            price, _ = self.rest_client.fetch_price(symbol)
-            self.datastore.update_price(symbol, price, self._now_dt_corrected())
-        self._last_rest_price_poll = now_mono
 
-    def _poll_rest_klines(self, now_mono: float) -> None:
-        if now_mono - self._last_rest_kline_poll < self.rest_kline_poll_seconds:
+        now_dt = self._now_dt_corrected()
+        submitted = [(apply_fn, self._submit_per_symbol(fetch)) for _, fetch, apply_fn in due]
+        for apply_fn, pairs in submitted:
+            for symbol, future in pairs:
+                apply_fn(symbol, future, now_dt)
+        for last_attr, _, _ in due:
+            setattr(self, last_attr, now_mono_ns)
+
+    def _poll_premium_batch(self, fetch_premium_all) -> bool:
+        now_dt = self._now_dt_corrected()
+        try:
+            rows = fetch_premium_all(self.symbols)
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.warning("premiumIndex batch poll failed: %s", exc)
+            return False
+        for symbol, mark, funding_rate, next_funding_ms, _ in rows:
+            self.datastore.update_premium_index(
+                symbol,
+                mark_price=mark,
+                last_funding_rate=funding_rate,
+                next_funding_time_ms=next_funding_ms,
+                ts=now_dt,
+            )
+        return True
+
+    def _apply_premium_index(self, symbol: str, future: Future, now_dt: datetime) -> None:
+        try:
+            mark, funding_rate, next_funding_ms, _ = future.result()
+            self.datastore.update_premium_index(
+                symbol,
+                mark_price=mark,
+                last_funding_rate=funding_rate,
+                next_funding_time_ms=next_funding_ms,
+                ts=now_dt,
+            )
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.warning("premiumIndex poll failed for %s: %s", symbol, exc)
+
+    def _apply_funding_history(self, symbol: str, future: Future, now_dt: datetime) -> None:
+        try:
+            history, _ = future.result()
+            self.datastore.update_funding_rate_history(symbol, history, now_dt)
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.warning("fundingRate poll failed for %s: %s", symbol, exc)
+
+    def _apply_open_interest(self, symbol: str, future: Future, now_dt: datetime) -> None:
+        try:
+            oi, _ = future.result()
+            self.datastore.update_open_interest(symbol, oi, now_dt)
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.warning("openInterest poll failed for %s: %s", symbol, exc)
+
+    def _poll_rest_prices(self, now_mono_ns: int) -> None:
+        if now_mono_ns - self._last_rest_price_poll < self._rest_price_poll_ns:
+            return
+        now_dt = self._now_dt_corrected()
+        fetch_prices = getattr(self.rest_client, "fetch_prices", None)
+        if fetch_prices is not None:
+            # One batched ticker call covers every symbol in a single RTT.
+            for symbol, price, _ in fetch_prices(self.symbols):
+                self.datastore.update_price(symbol, price, now_dt)
+        else:
+            for symbol, future in self._submit_per_symbol(self.rest_client.fetch_price):
+                price, _ = future.result()
+                self.datastore.update_price(symbol, price, now_dt)
+        self._last_rest_price_poll = now_mono_ns
+
+    def _poll_rest_klines(self, now_mono_ns: int) -> None:
+        if now_mono_ns - self._last_rest_kline_poll < self._rest_kline_poll_ns:
             return
         self._state_sync_from_rest(reason="rest_poll", limit=max(120, self.state_sync_klines))
-        self._last_rest_kline_poll = now_mono
+        self._last_rest_kline_poll = now_mono_ns
 
-    def _attempt_ws_recover(self, now_mono: float) -> None:
+    def _attempt_ws_recover(self, now_mono_ns: int) -> None:
         if self.preferred_mode != "ws":
             return
-        if now_mono < self._ws_next_retry_at:
+        if now_mono_ns < self._ws_next_retry_at:
             return
 
         if not self.ws_client.connected:
@@ -432,18 +593,16 @@ class SourceManager:
                 self.ws_client.connect()
                 self._ws_backoff = self.ws_backoff_min
             except Exception as exc:  # noqa: BLE001
-                self._ws_next_retry_at = now_mono + self._ws_backoff
-                self._ws_backoff = min(self._ws_backoff * 2, self.ws_backoff_max)
-                logging.warning("WS reconnect failed: %s", exc)
+                self._schedule_ws_retry(now_mono_ns)
+                _LOGGER.warning("WS reconnect failed: %s", exc)
                 return
 
         try:
             ticks, kline_ticks = self.ws_client.read_events()
         except Exception as exc:  # noqa: BLE001
             self.ws_client.close()
-            self._ws_next_retry_at = now_mono + self._ws_backoff
-            self._ws_backoff = min(self._ws_backoff * 2, self.ws_backoff_max)
-            logging.warning("WS recover read failed: %s", exc)
+            self._schedule_ws_retry(now_mono_ns)
+            _LOGGER.warning("WS recover read failed: %s", exc)
             return
 
         fresh_ticks = self._apply_ws_events(ticks, kline_ticks)
@@ -460,35 +619,48 @@ class SourceManager:
             self._state_sync_from_rest(reason=reason, limit=self.state_sync_klines)
             return True
         except Exception as exc:  # noqa: BLE001
-            logging.warning("State sync failed (%s): %s", reason, exc)
+            _LOGGER.warning("State sync failed (%s): %s", reason, exc)
             return False
 
     def _state_sync_from_rest(self, reason: str, limit: int) -> None:
         now_dt = self._now_dt_corrected()
-        for symbol in self.symbols:
-            klines, _ = self.rest_client.fetch_klines(symbol, limit=limit)
+        fetch = lambda s: self.rest_client.fetch_klines(s, limit=limit)  # noqa: E731
+        info_enabled = _LOGGER.isEnabledFor(logging.INFO)
+        for symbol, future in self._submit_per_symbol(fetch):
+            klines, _ = future.result()
             self.datastore.merge_klines(symbol, klines, now_dt)
-            logging.info("State sync (%s) for %s with %d klines", reason, symbol, len(klines))
+            if info_enabled:
+                _LOGGER.info("State sync (%s) for %s with %d klines", reason, symbol, len(klines))
 
     def _evaluate_staleness(self) -> None:
         if self._mode != "ws":
             return
 
         now_ms = self.now_ms_corrected()
+        # Cutoff form of raw_age_ms(now, ts) > threshold: one subtraction up
+        # front, then a single compare per field per symbol.
+        price_cutoff = now_ms - self._stale_ms
+        kline_cutoff = now_ms - self.kline_stale_ms
+        fresh_price = self._tick_fresh_price
+        fresh_kline = self._tick_fresh_kline
         for symbol in self.symbols:
-            snap = self.datastore.snapshot(symbol)
-            price_age_raw = self.raw_age_ms(now_ms, self.dt_to_ms(snap.last_price_ts))
-            kline_recv_raw = self.raw_age_ms(now_ms, self.dt_to_ms(snap.last_kline_recv_ts))
-            if price_age_raw is not None and price_age_raw > self.stale_seconds * 1000:
+            price_is_fresh = symbol in fresh_price
+            kline_is_fresh = symbol in fresh_kline
+            if price_is_fresh and kline_is_fresh:
+                continue
+            # timestamps() reads just the two fields needed here, so a tick
+            # that invalidated the snapshot cache does not force a rebuild.
+            price_ts_ms, kline_recv_ms = self.datastore.timestamps(symbol)
+            if not price_is_fresh and price_ts_ms is not None and price_ts_ms < price_cutoff:
                 self._switch_mode("rest", symbol=symbol, reason="stale")
                 return
-            if kline_recv_raw is not None and kline_recv_raw > self.kline_stale_ms:
-                logging.warning(
+            if not kline_is_fresh and kline_recv_ms is not None and kline_recv_ms < kline_cutoff:
+                _LOGGER.warning(
                     "kline_stale_switch unit=ms symbol=%s now_ms_corrected=%d last_kline_recv_ms=%s raw_age_ms=%d threshold_ms=%d",
                     symbol,
                     now_ms,
-                    self.dt_to_ms(snap.last_kline_recv_ts),
-                    kline_recv_raw,
+                    kline_recv_ms,
+                    now_ms - kline_recv_ms,
                     self.kline_stale_ms,
                 )
                 self._switch_mode("rest", symbol=symbol, reason="kline_stale")
@@ -500,12 +672,13 @@ class SourceManager:
             return
         self._mode = to_mode
         self.datastore.set_mode(to_mode)
-        logging.warning("source_mode_switch %s -> %s | reason=%s | symbol=%s", from_mode, to_mode, reason, symbol)
+        _LOGGER.warning("source_mode_switch %s -> %s | reason=%s | symbol=%s", from_mode, to_mode, reason, symbol)
 
-    def _log_health_if_needed(self, now_mono: float) -> None:
-        if now_mono - self._last_health_log < 60:
+    def _log_health_if_needed(self, now_mono_ns: int) -> None:
+        if now_mono_ns - self._last_health_log < _HEALTH_LOG_INTERVAL_NS:
             return
-        self._last_health_log = now_mono
+        self._last_health_log = now_mono_ns
+        info_enabled = _LOGGER.isEnabledFor(logging.INFO)
 
         now_ms = self.now_ms_corrected()
         clock_state = self._clock.state.state
@@ -515,15 +688,17 @@ class SourceManager:
             last_force_refresh_age_ms: int | None = None
             refresh_cooldown_remaining_ms = 0
         else:
-            last_force_refresh_age_ms = max(0, int(time.time() * 1000) - self._clock.state.last_force_refresh_local_ms)
+            last_force_refresh_age_ms = max(0, _time_ns() // 1_000_000 - self._clock.state.last_force_refresh_local_ms)
             refresh_cooldown_remaining_ms = max(0, self._clock.refresh_cooldown_ms - last_force_refresh_age_ms)
         if self._clock.state.last_sync_local_ms is None:
             last_server_sync_age_ms: int | None = None
         else:
-            last_server_sync_age_ms = max(0, int(time.time() * 1000) - self._clock.state.last_sync_local_ms)
+            last_server_sync_age_ms = max(0, _time_ns() // 1_000_000 - self._clock.state.last_sync_local_ms)
 
-        for symbol in self.symbols:
-            snap = self.datastore.snapshot(symbol)
+        # One batched pass per cycle instead of two store calls per symbol.
+        buffer_sizes = self.datastore.buffer_sizes_all()
+        for snap in self.datastore.snapshot_all():
+            symbol = snap.symbol
             fields = {
                 "last_price": self.dt_to_ms(snap.last_price_ts),
                 "last_kline_close": self.dt_to_ms(snap.last_kline_close_ts),
@@ -534,7 +709,7 @@ class SourceManager:
             raws = {name: self.raw_age_ms(now_ms, ts_ms) for name, ts_ms in fields.items()}
             for field_name, raw_age in raws.items():
                 if raw_age is not None and raw_age < 0:
-                    logging.warning(
+                    _LOGGER.warning(
                         "timestamp_in_future unit=ms symbol=%s field=%s ahead_ms=%d now_ms_corrected=%d ts_ms=%s",
                         symbol,
                         field_name,
@@ -543,13 +718,11 @@ class SourceManager:
                         fields[field_name],
                     )
 
-            price_size, kline_size = self.datastore.buffer_sizes(symbol)
-            logging.info(
-                "health mode=%s symbol=%s now_ms_corrected=%d clock_skew_ms=%d clock_state=%s drift_ms=%s drift_ms_source=%s last_server_sync_age_ms=%s last_force_refresh_age_ms=%s refresh_cooldown_remaining_ms=%s "
-                "last_price_ts_ms=%s last_kline_close_ts_ms=%s last_kline_recv_ts_ms=%s funding_ts_ms=%s open_interest_ts_ms=%s "
-                "last_price_raw_age_ms=%s last_kline_close_raw_age_ms=%s last_kline_recv_raw_age_ms=%s funding_raw_age_ms=%s oi_raw_age_ms=%s "
-                "last_price_age_seconds=%s last_kline_age_seconds=%s last_kline_recv_age_seconds=%s funding_age_seconds=%s oi_age_seconds=%s "
-                "price_buffer=%d kline_buffer=%d",
+            if not info_enabled:
+                continue
+            price_size, kline_size = buffer_sizes[symbol]
+            _LOGGER.info(
+                _HEALTH_LOG_FMT,
                 self._mode,
                 symbol,
                 now_ms,
@@ -3,10 +3,23 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import logging
+import math
+from operator import attrgetter
 
 from dark_alpha_phase_one.engine.signal_context import SignalContext
 from dark_alpha_phase_one.models import ProposalCard
 
+_ENTRY = attrgetter("entry")
+_STOP = attrgetter("stop")
+
+
+def _card_rank(card: ProposalCard) -> tuple[int, float, int]:
+    return (card.priority, card.confidence, -card.ttl_minutes)
+
+# Cached root logger; the candidate dump below is guarded so the per-card
+# dicts are never built when INFO is filtered.
+_LOGGER = logging.getLogger()
+
 
 @dataclass(frozen=True)
 class ArbitratorConfig:
@@ -24,39 +37,36 @@ class Arbitrator:
         if not cards:
             return None
 
-        logging.info(
-            "arbitration candidates symbol=%s cards=%s",
-            ctx.symbol,
-            [
-                {
-                    "strategy": c.strategy,
-                    "side": c.side,
-                    "entry": c.entry,
-                    "stop": c.stop,
-                    "priority": c.priority,
-                    "confidence": c.confidence,
-                }
-                for c in cards
-            ],
-        )
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                "arbitration candidates symbol=%s cards=%s",
+                ctx.symbol,
+                [
+                    {
+                        "strategy": c.strategy,
+                        "side": c.side,
+                        "entry": c.entry,
+                        "stop": c.stop,
+                        "priority": c.priority,
+                        "confidence": c.confidence,
+                    }
+                    for c in cards
+                ],
+            )
 
         now = ctx.timestamp if ctx.timestamp.tzinfo else ctx.timestamp.replace(tzinfo=timezone.utc)
         last_sent = self.last_sent_lookup(ctx.symbol)
         if last_sent is not None and (now - last_sent).total_seconds() <= self.config.dedupe_window_seconds:
-            logging.info("arbitration dropped symbol=%s reason=dedupe_window", ctx.symbol)
+            _LOGGER.info("arbitration dropped symbol=%s reason=dedupe_window", ctx.symbol)
             return None
 
-        selected = cards[:]
-        selected = self._dedupe_similar(selected)
+        selected = self._dedupe_similar(cards)
         if not selected:
             return None
 
-        winner = sorted(
-            selected,
-            key=lambda c: (c.priority, c.confidence, -c.ttl_minutes),
-            reverse=True,
-        )[0]
-        logging.info(
+        # _dedupe_similar keeps cards in rank order, so the head is the winner.
+        winner = selected[0]
+        _LOGGER.info(
             "arbitration winner symbol=%s strategy=%s side=%s priority=%s confidence=%.2f",
             ctx.symbol,
             winner.strategy,
@@ -67,21 +77,54 @@ class Arbitrator:
         return winner
 
     def _dedupe_similar(self, cards: list[ProposalCard]) -> list[ProposalCard]:
+        # Bucketed dedupe: entries/stops are quantized on a log scale sized
+        # to the similarity thresholds, so each card probes a few dict keys
+        # instead of comparing against every kept card. The similarity band
+        # spans just over two bucket widths (log(1+pct)-log(1-pct) vs
+        # log1p(pct)), and int() truncation can shift keys one more, so the
+        # probe covers key +/- 2; the exact ratio check decides on hits.
+        entry_pct = self.config.entry_similar_pct
+        stop_pct = self.config.stop_similar_pct
+        entry_scale = 1.0 / math.log1p(entry_pct)
+        stop_scale = 1.0 / math.log1p(stop_pct)
+
         kept: list[ProposalCard] = []
-        for card in sorted(cards, key=lambda c: (c.priority, c.confidence, -c.ttl_minutes), reverse=True):
-            duplicate = False
-            for existing in kept:
-                same_side = existing.side == card.side
-                entry_close = abs(existing.entry - card.entry) / max(existing.entry, 1e-9) < self.config.entry_similar_pct
-                stop_close = abs(existing.stop - card.stop) / max(abs(existing.stop), 1e-9) < self.config.stop_similar_pct
-                if same_side and (entry_close or stop_close):
-                    duplicate = True
-                    logging.info(
-                        "arbitration dropped strategy=%s reason=similar_entry_or_stop winner=%s",
-                        card.strategy,
-                        existing.strategy,
-                    )
-                    break
-            if not duplicate:
-                kept.append(card)
+        entry_buckets: dict[tuple[str, int], list[ProposalCard]] = {}
+        stop_buckets: dict[tuple[str, int], list[ProposalCard]] = {}
+        for card in sorted(cards, key=_card_rank, reverse=True):
+            entry_key = int(math.log(max(card.entry, 1e-9)) * entry_scale)
+            stop_key = int(math.log(max(abs(card.stop), 1e-9)) * stop_scale)
+
+            duplicate = self._find_similar(
+                entry_buckets, card.side, entry_key, card.entry, entry_pct, _ENTRY
+            ) or self._find_similar(
+                stop_buckets, card.side, stop_key, abs(card.stop), stop_pct, _STOP
+            )
+            if duplicate is not None:
+                _LOGGER.info(
+                    "arbitration dropped strategy=%s reason=similar_entry_or_stop winner=%s",
+                    card.strategy,
+                    duplicate.strategy,
+                )
+                continue
+
+            kept.append(card)
+            entry_buckets.setdefault((card.side, entry_key), []).append(card)
+            stop_buckets.setdefault((card.side, stop_key), []).append(card)
         return kept
+
+    @staticmethod
+    def _find_similar(
+        buckets: dict[tuple[str, int], list[ProposalCard]],
+        side: str,
+        key: int,
+        value: float,
+        similar_pct: float,
+        field,
+    ) -> ProposalCard | None:
+        for neighbor in (key - 2, key - 1, key, key + 1, key + 2):
+            for existing in buckets.get((side, neighbor), ()):
+                existing_value = abs(field(existing))
+                if abs(existing_value - value) / max(existing_value, 1e-9) < similar_pct:
+                    return existing
+        return None
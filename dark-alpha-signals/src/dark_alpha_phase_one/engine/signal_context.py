@@ -6,7 +6,7 @@ from datetime import datetime
 from dark_alpha_phase_one.calculations import Candle
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignalContext:
     symbol: str
     timestamp: datetime
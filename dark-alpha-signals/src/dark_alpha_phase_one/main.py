@@ -1,16 +1,33 @@
 from __future__ import annotations
 
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
 
 from .config import load_settings
 from .service import SignalService
 
 
-def main() -> None:
+def _setup_logging() -> None:
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
     )
+    # Route records through a queue so handler/stream IO happens on a
+    # background thread instead of inside the refresh tick. Note that
+    # QueueHandler.prepare() still runs format() on the emitting thread;
+    # only the blocking writes move off the hot path.
+    root = logging.getLogger()
+    log_queue: Queue = Queue(-1)
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
+
+
+def main() -> None:
+    _setup_logging()
     settings = load_settings()
     service = SignalService(settings)
     service.run_forever()
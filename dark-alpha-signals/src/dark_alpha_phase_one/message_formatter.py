@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from html import escape
+import re
 from typing import Any
 
+# Single-pass action check + split; mirrors the old split(":", maxsplit=2)
+# exactly: the symbol is anything up to the next colon and the trace id
+# keeps any further colons.
+_CALLBACK_RE = re.compile(r"\A(copy_levels|detail):([^:]*):(.*)\Z", re.DOTALL)
+
 
 def _to_float(value: Any) -> float | None:
     if value is None:
@@ -24,6 +31,18 @@ def _to_int(value: Any) -> int | None:
     return int(parsed)
 
 
+# Exchanges expose a handful of distinct tick sizes, so the 16-digit
+# string parse runs once per tick size instead of once per message. The
+# parse stays (rather than a log10 round-trip) because non-power-of-ten
+# ticks like 0.25 need the full decimal expansion.
+@lru_cache(maxsize=1024)
+def _decimals_for_tick(tick_size: float) -> int:
+    as_text = f"{tick_size:.16f}".rstrip("0")
+    if "." in as_text:
+        return len(as_text.split(".", maxsplit=1)[1])
+    return 0
+
+
 def _price_decimals(payload: dict[str, Any]) -> int:
     precision = _to_int(payload.get("price_precision"))
     if precision is not None and precision >= 0:
@@ -31,10 +50,7 @@ def _price_decimals(payload: dict[str, Any]) -> int:
 
     tick_size = _to_float(payload.get("tick_size"))
     if tick_size is not None and tick_size > 0:
-        as_text = f"{tick_size:.16f}".rstrip("0")
-        if "." in as_text:
-            return len(as_text.split(".", maxsplit=1)[1])
-        return 0
+        return _decimals_for_tick(tick_size)
 
     return 2
 
@@ -43,10 +59,8 @@ def _format_number(value: Any, decimals: int = 2) -> str:
     parsed = _to_float(value)
     if parsed is None:
         return "na"
-    text = f"{parsed:,.{max(decimals, 0)}f}"
-    if decimals == 0:
-        text = text.split(".", maxsplit=1)[0]
-    return text
+    # ",.0f" already renders without a decimal point, so no split fixup.
+    return f"{parsed:,.{max(decimals, 0)}f}"
 
 
 def _format_percent(value: Any) -> str:
@@ -88,20 +102,19 @@ def tradingview_url(symbol: str, exchange: str = "BINANCE") -> str:
 
 
 def parse_callback_data(callback_data: str) -> tuple[str, str, str] | None:
-    parts = callback_data.split(":", maxsplit=2)
-    if len(parts) != 3:
-        return None
-    action, symbol, trace_id = parts
-    if action not in {"copy_levels", "detail"}:
+    match = _CALLBACK_RE.match(callback_data)
+    if match is None:
         return None
+    action, symbol, trace_id = match.groups()
     return action, symbol.upper(), trace_id
 
 
-def build_signal_keyboard(payload: dict[str, Any]) -> dict[str, object]:
-    symbol = str(payload.get("symbol") or "NA").upper()
-    exchange = str(payload.get("exchange") or "BINANCE")
-    trace_id = str(payload.get("trace_id") or "na")
-
+# The same signal is formatted several times (send + edit + logging), so
+# the keyboard dict is memoized per (symbol, exchange, trace_id). Callers
+# pass the returned dict straight to the Telegram API and never mutate
+# it, so sharing one instance is safe.
+@lru_cache(maxsize=4096)
+def _keyboard_for(symbol: str, exchange: str, trace_id: str) -> dict[str, object]:
     copy_data = f"copy_levels:{symbol}:{trace_id}"[:64]
     detail_data = f"detail:{symbol}:{trace_id}"[:64]
 
@@ -118,6 +131,13 @@ def build_signal_keyboard(payload: dict[str, Any]) -> dict[str, object]:
     }
 
 
+def build_signal_keyboard(payload: dict[str, Any]) -> dict[str, object]:
+    symbol = str(payload.get("symbol") or "NA").upper()
+    exchange = str(payload.get("exchange") or "BINANCE")
+    trace_id = str(payload.get("trace_id") or "na")
+    return _keyboard_for(symbol, exchange, trace_id)
+
+
 def format_signal_message(payload: dict[str, Any]) -> tuple[str, str]:
     symbol = escape(str(payload.get("symbol") or "na").upper())
     side = str(payload.get("side") or "").upper()
@@ -133,7 +153,9 @@ def format_signal_message(payload: dict[str, Any]) -> tuple[str, str]:
     leverage = _to_int(payload.get("leverage_suggest"))
     leverage_text = f"{leverage}x" if leverage is not None else "na"
     position = _format_number(payload.get("position_usdt"), decimals=2)
+    position_unit = " USDT" if position != "na" else ""
     risk = _format_number(payload.get("max_risk_usdt"), decimals=2)
+    risk_unit = " USDT" if risk != "na" else ""
     ttl = _to_int(payload.get("ttl_minutes"))
     ttl_text = f"{ttl} 分鐘" if ttl is not None else "na"
     confidence = _format_percent(payload.get("confidence"))
@@ -152,8 +174,8 @@ def format_signal_message(payload: dict[str, Any]) -> tuple[str, str]:
         f"🎯 <b>止盈：</b>{take_profit}",
         f"⚡ <b>槓桿：</b>{escape(leverage_text)}",
         "",
-        f"💰 <b>倉位：</b>{position} USDT" if position != "na" else "💰 <b>倉位：</b>na",
-        f"🎯 <b>最大風險：</b>{risk} USDT" if risk != "na" else "🎯 <b>最大風險：</b>na",
+        f"💰 <b>倉位：</b>{position}{position_unit}",
+        f"🎯 <b>最大風險：</b>{risk}{risk_unit}",
         f"⏳ <b>有效：</b>{ttl_text}",
         f"📊 <b>信心：</b>{confidence}",
         f"⚠️ <b>風險：</b>{risk_level}",
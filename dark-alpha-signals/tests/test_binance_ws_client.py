@@ -68,6 +68,25 @@ def test_ws_client_parses_bookticker_and_kline_events() -> None:
     assert kline_ticks[0].is_closed is True
 
 
+def test_ws_client_bookticker_malformed_side_falls_back_to_other() -> None:
+    messages = [
+        json.dumps(
+            {
+                "stream": "btcusdt@bookTicker",
+                "data": {"e": "bookTicker", "E": 1700000000000, "s": "BTCUSDT", "b": "abc", "a": "102"},
+            }
+        ),
+    ]
+    socket = FakeSocket(messages)
+    client = BinanceWsClient(symbols=["BTCUSDT"], ws_factory=lambda: socket)
+
+    client.connect()
+    ticks, _ = client.read_events()
+
+    assert len(ticks) == 1
+    assert ticks[0].price == 102.0
+
+
 def test_ws_client_close_marks_disconnected() -> None:
     socket = FakeSocket([])
     client = BinanceWsClient(symbols=["BTCUSDT"], ws_factory=lambda: socket)
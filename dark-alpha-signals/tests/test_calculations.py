@@ -45,3 +45,24 @@ def test_atr_series_has_values_with_sufficient_warmup() -> None:
 
     assert atr_values
     assert atr_values[-1] > 0
+
+
+def test_oi_running_stats_matches_batch_zscore() -> None:
+    from dark_alpha_phase_one.calculations import (
+        OiRunningStats,
+        compute_oi_delta_pct_15m,
+        compute_oi_zscore_15m,
+    )
+
+    windows = [100.0 + (i % 7) * 3.5 for i in range(120)]
+    stats = OiRunningStats(baseline_windows=96)
+    for value in windows[:-1]:
+        stats.push(value)
+
+    current = windows[-1]
+    batch_zscore = compute_oi_zscore_15m(windows, baseline_windows=96)
+    batch_delta = compute_oi_delta_pct_15m(windows)
+
+    assert batch_zscore is not None
+    assert abs(stats.zscore(current) - batch_zscore) < 1e-9
+    assert abs(stats.delta_pct(current) - batch_delta) < 1e-12
@@ -0,0 +1,19 @@
+from dark_alpha_phase_one.calculations_numba import StreamingAtr, atr_update
+
+
+def test_atr_update_wilder_step() -> None:
+    new_atr, tr = atr_update(2.0, 100.0, 103.0, 99.0, 102.0, 14)
+    assert tr == 4.0
+    assert round(new_atr, 6) == round(2.0 + (4.0 - 2.0) / 14, 6)
+
+
+def test_streaming_atr_warms_up_then_updates() -> None:
+    streaming = StreamingAtr(period=3)
+    assert streaming.update(101.0, 99.0, 100.0) is None
+    assert streaming.update(102.0, 100.0, 101.0) is None
+    first_atr = streaming.update(103.0, 101.0, 102.0)
+    assert first_atr is not None and first_atr > 0
+
+    next_atr = streaming.update(104.0, 102.0, 103.0)
+    assert next_atr is not None
+    assert streaming.value == next_atr
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from json import loads
+
+from dark_alpha_phase_one.calculations import Candle
+from dark_alpha_phase_one.data.datastore import DataStore, FundingRatePoint
+
+
+def _store() -> DataStore:
+    return DataStore(symbols=["BTCUSDT"])
+
+
+def test_snapshot_bytes_round_trips_rest_klines() -> None:
+    datastore = _store()
+    ts = datetime.now(tz=timezone.utc)
+    datastore.update_price("BTCUSDT", 100.5, ts)
+    datastore.merge_klines("BTCUSDT", [Candle(open=100, high=101, low=99, close=100.5)], ts)
+
+    payload = loads(datastore.snapshot_bytes("BTCUSDT"))
+
+    assert payload["symbol"] == "BTCUSDT"
+    assert payload["price"] == 100.5
+    assert payload["klines_1m"] == [[100, 101, 99, 100.5]]
+    assert payload["last_price_ts_ms"] == int(ts.timestamp() * 1000)
+    assert payload["data_source_mode"] == "rest"
+
+
+def test_partial_then_close_of_same_open_time() -> None:
+    datastore = _store()
+    ts = datetime.now(tz=timezone.utc)
+    partial = Candle(open=100, high=100.5, low=99.5, close=100.2)
+    closed = Candle(open=100, high=101, low=99.5, close=100.8)
+
+    datastore.upsert_ws_kline("BTCUSDT", partial, 1700000000000, is_closed=False, ts=ts)
+    snap = datastore.snapshot("BTCUSDT")
+    assert snap.klines_1m == (partial,)
+    assert snap.last_kline_close_ts is None
+
+    datastore.upsert_ws_kline("BTCUSDT", closed, 1700000000000, is_closed=True, ts=ts)
+    snap = datastore.snapshot("BTCUSDT")
+    assert snap.klines_1m == (closed,)
+    assert snap.last_kline_close_ts == ts
+
+
+def test_partial_for_next_open_time_appends_after_closed_candle() -> None:
+    datastore = _store()
+    ts = datetime.now(tz=timezone.utc)
+    closed = Candle(open=100, high=101, low=99.5, close=100.8)
+    partial = Candle(open=100.8, high=100.9, low=100.7, close=100.85)
+
+    datastore.upsert_ws_kline("BTCUSDT", closed, 1700000000000, is_closed=True, ts=ts)
+    datastore.upsert_ws_kline("BTCUSDT", partial, 1700000060000, is_closed=False, ts=ts)
+
+    snap = datastore.snapshot("BTCUSDT")
+    assert snap.klines_1m == (closed, partial)
+
+
+def test_late_partial_for_closed_open_time_replaces_last_candle() -> None:
+    datastore = _store()
+    ts = datetime.now(tz=timezone.utc)
+    closed = Candle(open=100, high=101, low=99.5, close=100.8)
+    update = Candle(open=100, high=101.2, low=99.5, close=101.0)
+
+    datastore.upsert_ws_kline("BTCUSDT", closed, 1700000000000, is_closed=True, ts=ts)
+    datastore.upsert_ws_kline("BTCUSDT", update, 1700000000000, is_closed=False, ts=ts)
+
+    snap = datastore.snapshot("BTCUSDT")
+    assert snap.klines_1m == (update,)
+
+
+def test_merge_klines_discards_pending_partial() -> None:
+    datastore = _store()
+    ts = datetime.now(tz=timezone.utc)
+    partial = Candle(open=100, high=100.5, low=99.5, close=100.2)
+    rest = Candle(open=99, high=100, low=98.5, close=99.8)
+
+    datastore.upsert_ws_kline("BTCUSDT", partial, 1700000000000, is_closed=False, ts=ts)
+    datastore.merge_klines("BTCUSDT", [rest], ts)
+
+    snap = datastore.snapshot("BTCUSDT")
+    assert snap.klines_1m == (rest,)
+
+
+def test_update_prices_batch_groups_by_symbol() -> None:
+    datastore = DataStore(symbols=["BTCUSDT", "ETHUSDT"])
+    ts = datetime.now(tz=timezone.utc)
+
+    datastore.update_prices(
+        [("BTCUSDT", 100.0), ("ETHUSDT", 2000.0), ("BTCUSDT", 100.5)], ts
+    )
+
+    btc = datastore.snapshot("BTCUSDT")
+    eth = datastore.snapshot("ETHUSDT")
+    assert btc.price == 100.5
+    assert btc.last_price_ts == ts
+    assert eth.price == 2000.0
+    assert datastore.buffer_sizes("BTCUSDT") == (2, 0)
+    assert datastore.buffer_sizes("ETHUSDT") == (1, 0)
+
+
+def test_snapshot_cache_is_reused_and_invalidated_by_every_mutator() -> None:
+    datastore = _store()
+    ts = datetime.now(tz=timezone.utc)
+    candle = Candle(open=100, high=101, low=99, close=100.5)
+    point = FundingRatePoint(funding_rate=0.0001, funding_time=1700000000000)
+
+    datastore.update_price("BTCUSDT", 100.0, ts)
+    snap = datastore.snapshot("BTCUSDT")
+    assert datastore.snapshot("BTCUSDT") is snap
+
+    mutations = [
+        lambda: datastore.update_price("BTCUSDT", 101.0, ts),
+        lambda: datastore.merge_klines("BTCUSDT", [candle], ts),
+        lambda: datastore.upsert_ws_kline("BTCUSDT", candle, 1700000060000, is_closed=True, ts=ts),
+        lambda: datastore.update_premium_index(
+            "BTCUSDT", mark_price=101.0, last_funding_rate=0.0001, next_funding_time_ms=1700000000000, ts=ts
+        ),
+        lambda: datastore.update_funding_rate_history("BTCUSDT", [point], ts),
+        lambda: datastore.append_funding_rate_point(
+            "BTCUSDT", FundingRatePoint(funding_rate=0.0002, funding_time=1700000001000), ts
+        ),
+        lambda: datastore.update_open_interest("BTCUSDT", 12345.0, ts),
+    ]
+    for mutate in mutations:
+        before = datastore.snapshot("BTCUSDT")
+        mutate()
+        after = datastore.snapshot("BTCUSDT")
+        assert after is not before
+
+
+def test_set_mode_flip_invalidates_snapshot() -> None:
+    datastore = _store()
+    datastore.update_price("BTCUSDT", 100.0, datetime.now(tz=timezone.utc))
+
+    assert datastore.snapshot("BTCUSDT").data_source_mode == "rest"
+    datastore.set_mode("ws")
+    assert datastore.snapshot("BTCUSDT").data_source_mode == "ws"
+
+    # Re-setting the same mode keeps the cached snapshot.
+    snap = datastore.snapshot("BTCUSDT")
+    datastore.set_mode("ws")
+    assert datastore.snapshot("BTCUSDT") is snap
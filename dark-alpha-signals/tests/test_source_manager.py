@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+import time
 
 from dark_alpha_phase_one.calculations import Candle
 from dark_alpha_phase_one.data.binance_ws import WsKlineTick, WsTick
@@ -44,6 +45,7 @@ class FakeWsClient:
     def __init__(self) -> None:
         self.connected = True
         self.raise_exc = False
+        self.last_close_code: int | None = None
         self.ticks: list[WsTick] = []
         self.kline_ticks: list[WsKlineTick] = []
 
@@ -211,6 +213,40 @@ def test_derivatives_are_polled_and_stored() -> None:
     assert len(snapshot.funding_rate_history) == 1
 
 
+def test_ws_retry_backoff_doubles_on_ordinary_failure() -> None:
+    datastore = DataStore(symbols=["BTCUSDT"])
+    ws = FakeWsClient()
+    manager = _manager(datastore, FakeRestClient(), ws)
+
+    ws.raise_exc = True
+    manager.refresh()
+    assert manager.current_mode() == "rest"
+
+    manager.refresh()  # reconnect succeeds, read fails, retry scheduled
+
+    assert manager._ws_backoff == 2 * manager.ws_backoff_min
+
+
+def test_ws_close_code_1013_jumps_backoff_to_max() -> None:
+    datastore = DataStore(symbols=["BTCUSDT"])
+    ws = FakeWsClient()
+    manager = _manager(datastore, FakeRestClient(), ws)
+
+    ws.raise_exc = True
+    ws.last_close_code = 1013
+    manager.refresh()
+    assert manager.current_mode() == "rest"
+
+    before_ns = time.monotonic_ns()
+    manager.refresh()
+
+    assert manager._ws_backoff == manager.ws_backoff_max
+    # Jittered delay stays within +/-25% of the max backoff.
+    delay_ns = manager._ws_next_retry_at - before_ns
+    assert delay_ns <= int(1.25 * manager.ws_backoff_max * 1_000_000_000)
+    assert delay_ns >= int(0.70 * manager.ws_backoff_max * 1_000_000_000)
+
+
 def test_raw_age_ms_supports_future_timestamp() -> None:
     now_ms = 1_700_000_000_000
     future_ms = now_ms + 300